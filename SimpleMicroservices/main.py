@@ -1,33 +1,174 @@
 from __future__ import annotations
 
+import itertools
 import os
 import socket
+import threading
+import time
+from collections import defaultdict
+from dataclasses import replace
 from datetime import datetime
 
-from typing import Dict, List
-from uuid import UUID
+from typing import Any, DefaultDict, Dict, Iterable, List, Set, Tuple, get_args
+from uuid import UUID, uuid4
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi import Query, Path
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
 from typing import Optional
+from pydantic import BaseModel, ValidationError
 
 from models.anime import AnimeCreate, AnimeRead, AnimeUpdate
 from models.characters import CharacterCreate, CharacterRead, CharacterUpdate
 from models.health import Health
+from models.records import AnimeRecord, CharacterReadRecord, CharacterRecord
 
 port = int(os.environ.get("FASTAPIPORT", 8003))
 
+# The host's address does not change while the process runs; resolve it once
+# here rather than hitting the resolver on every /health call.
+_HOST_IP = socket.gethostbyname(socket.gethostname())
+
+
 # -----------------------------------------------------------------------------
 # Fake in-memory "databases"
 # -----------------------------------------------------------------------------
 
-animes: Dict[UUID, AnimeRead] = {}
-characters: Dict[UUID, CharacterRead] = {}
+# Each record is kept next to its pre-serialized JSON so reads never re-encode;
+# the bytes are recomputed whenever the record is written (POST/PATCH).
+animes: Dict[UUID, Tuple[AnimeRecord, bytes]] = {}
+characters: Dict[UUID, Tuple[CharacterReadRecord, bytes]] = {}
+
+
+def _dump(record: AnimeRecord | CharacterReadRecord) -> bytes:
+    return orjson.dumps(record)
+
+
+def _json_bytes(blob: bytes, status_code: int = 200) -> Response:
+    return Response(content=blob, status_code=status_code, media_type="application/json")
+
+
+def _json_array(blobs: List[bytes]) -> Response:
+    return _json_bytes(b"[" + b",".join(blobs) + b"]")
+
+
+# -----------------------------------------------------------------------------
+# Secondary indexes: field -> value -> IDs of the records holding that value
+# -----------------------------------------------------------------------------
+Index = Dict[str, DefaultDict[Any, Set[UUID]]]
+
+anime_index: Index = {
+    field: defaultdict(set)
+    for field in ("title", "genre", "seasons", "rating", "status", "streaming")
+}
+# Animes keyed by the fields of their embedded characters (any character matches)
+anime_character_index: Index = {
+    field: defaultdict(set)
+    for field in ("role", "gender")
+}
+character_index: Index = {
+    field: defaultdict(set)
+    for field in ("name", "role", "alias", "gender", "ability")
+}
+
+# Sync handlers run in FastAPI's threadpool. Writers hold this lock across
+# their whole check-then-save, so a record and its index entries change
+# together and concurrent writes to one ID cannot interleave; readers only
+# iterate over copies.
+_store_lock = threading.Lock()
+
+# Insertion sequence per ID, so filtered lists can be returned in store order
+# by sorting only the matches instead of walking the whole store.
+anime_seq: Dict[UUID, int] = {}
+character_seq: Dict[UUID, int] = {}
+_next_seq = itertools.count()
+
+
+def _index(index: Index, record_id: UUID, items: Iterable[Any]) -> None:
+    for field, buckets in index.items():
+        for item in items:
+            buckets[getattr(item, field)].add(record_id)
+
+
+def _unindex(index: Index, record_id: UUID, items: Iterable[Any]) -> None:
+    for field, buckets in index.items():
+        for item in items:
+            value = getattr(item, field)
+            ids = buckets.get(value)
+            if ids is None:
+                continue
+            ids.discard(record_id)
+            if not ids:
+                del buckets[value]
+
+
+def _lookup(
+    index: Index,
+    filters: Dict[str, Any],
+    candidates: Optional[Set[UUID]] = None,
+) -> Optional[Set[UUID]]:
+    """Narrow `candidates` (None meaning "everything") by each non-None filter."""
+    for field, value in filters.items():
+        if value is None:
+            continue
+        # Copy the live bucket (a single C-level operation) before handing it out
+        ids = set(index[field].get(value, ()))
+        candidates = ids if candidates is None else candidates & ids
+    return candidates
+
+
+def _save_character(record: CharacterReadRecord) -> None:
+    """Store `record` and reindex it. Caller must hold `_store_lock`."""
+    if record.id in characters:
+        _unindex(character_index, record.id, [characters[record.id][0]])
+    else:
+        character_seq[record.id] = next(_next_seq)
+    characters[record.id] = (record, _dump(record))
+    _index(character_index, record.id, [record])
+
+
+def _save_anime(record: AnimeRecord) -> None:
+    """Store `record` and reindex it. Caller must hold `_store_lock`."""
+    if record.id in animes:
+        old = animes[record.id][0]
+        _unindex(anime_index, record.id, [old])
+        _unindex(anime_character_index, record.id, old.characters)
+    else:
+        anime_seq[record.id] = next(_next_seq)
+    animes[record.id] = (record, _dump(record))
+    _index(anime_index, record.id, [record])
+    _index(anime_character_index, record.id, record.characters)
+
+
+def _patch(update: BaseModel, read_model: type[BaseModel]) -> Dict[str, Any]:
+    """Fields the client sent, refusing nulls where `read_model` isn't Optional.
+
+    The Update models make every field Optional, so an explicit null would
+    otherwise land in the stored record (and its indexes) unchecked.
+    """
+    patch = {field: getattr(update, field) for field in update.model_fields_set}
+    errors = [
+        {"type": "value_error", "loc": ("body", field), "msg": "Field cannot be null", "input": None}
+        for field, value in patch.items()
+        if value is None and type(None) not in get_args(read_model.model_fields[field].annotation)
+    ]
+    if errors:
+        raise RequestValidationError(errors)
+    return patch
+
+
+def _anime_record(data: Dict[str, Any]) -> AnimeRecord:
+    data["characters"] = [CharacterRecord(**c) for c in data["characters"]]
+    return AnimeRecord(**data)
+
 
 app = FastAPI(
     title="Anime/Character API",
     description="Demo FastAPI app using Pydantic v2 models for Anime and Characters",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -35,8 +176,8 @@ def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Health:
     return Health(
         status=200,
         status_message="OK",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        ip_address=socket.gethostbyname(socket.gethostname()),
+        timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        ip_address=_HOST_IP,
         echo=echo,
         path_echo=path_echo
     )
@@ -59,12 +200,16 @@ def get_health_with_path(
 # -----------------------------------------------------------------------------
 @app.post("/characters", response_model=CharacterRead, status_code=201)
 def create_character(character: CharacterCreate):
-    if character.id in characters:
-        raise HTTPException(status_code=400, detail="Character with this ID already exists")
-    characters[character.id] = CharacterRead(**character.model_dump())
-    return characters[character.id]
+    now = datetime.utcnow()
+    record = CharacterReadRecord(**character.model_dump(), created_at=now, updated_at=now)
+    with _store_lock:
+        if character.id in characters:
+            raise HTTPException(status_code=400, detail="Character with this ID already exists")
+        _save_character(record)
+        blob = characters[record.id][1]
+    return _json_bytes(blob, status_code=201)
 
-@app.get("/characters", response_model=List[CharacterRead])
+@app.get("/characters", responses={200: {"model": List[CharacterRead]}})
 def list_characters(
     name: Optional[str] = Query(None, description="Filter by name"),
     role: Optional[str] = Query(None, description="Filter by role"),
@@ -72,95 +217,113 @@ def list_characters(
     gender: Optional[str] = Query(None, description="Filter by gender"),
     ability: Optional[str] = Query(None, description="Filter by ability"),
 ):
-    results = list(characters.values())
-
-    if name is not None:
-        results = [a for a in results if a.name == name]
-    if role is not None:
-        results = [a for a in results if a.role == role]
-    if alias is not None:
-        results = [a for a in results if a.alias == alias]
-    if gender is not None:
-        results = [a for a in results if a.gender == gender]
-    if ability is not None:
-        results = [a for a in results if a.ability == ability]
-
-    return results
-
-@app.get("/characters/{character_id}", response_model=CharacterRead)
+    ids = _lookup(character_index, {
+        "name": name, "role": role, "alias": alias, "gender": gender, "ability": ability,
+    })
+    if ids is None:
+        return _json_array([blob for _, blob in list(characters.values())])
+    return _json_array([characters[i][1] for i in sorted(ids, key=character_seq.__getitem__)])
+
+@app.get("/characters/{character_id}", responses={200: {"model": CharacterRead}})
 def get_character(character_id: UUID):
     if character_id not in characters:
         raise HTTPException(status_code=404, detail="character not found")
-    return characters[character_id]
+    return _json_bytes(characters[character_id][1])
 
 @app.patch("/characters/{character_id}", response_model=CharacterRead)
 def update_character(character_id: UUID, update: CharacterUpdate):
-    if character_id not in characters:
-        raise HTTPException(status_code=404, detail="Character not found")
-    stored = characters[character_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    characters[character_id] = CharacterRead(**stored)
-    return characters[character_id]
+    with _store_lock:
+        if character_id not in characters:
+            raise HTTPException(status_code=404, detail="Character not found")
+        # Copy the stored record, touching only the fields the client sent
+        patch = _patch(update, CharacterRead)
+        record = replace(characters[character_id][0], **patch, updated_at=datetime.utcnow())
+        _save_character(record)
+    return record
 
 
 # -----------------------------------------------------------------------------
 # Anime endpoints
 # -----------------------------------------------------------------------------
-@app.post("/animes", response_model=AnimeRead, status_code=201)
-def create_anime(anime: AnimeCreate):
-    # Each anime gets its own UUID; stored as AnimeRead
-    anime_read = AnimeRead(**anime.model_dump())
-    animes[anime_read.id] = anime_read
-    return anime_read
-
-@app.get("/animes", response_model=List[AnimeRead])
+# The raw body is validated by AnimeCreate.model_validate_json rather than
+# through FastAPI, so publish AnimeCreate's schema by hand to keep it in the
+# OpenAPI docs.
+_ANIME_CREATE_SCHEMA = AnimeCreate.model_json_schema(ref_template="#/components/schemas/{model}")
+_ANIME_CREATE_SCHEMA.pop("$defs", None)
+
+
+@app.post(
+    "/animes",
+    response_model=AnimeRead,
+    status_code=201,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _ANIME_CREATE_SCHEMA}},
+        }
+    },
+)
+async def create_anime(request: Request):
+    body = await request.body()
+    try:
+        # pydantic-core parses and validates the bytes in one pass, skipping
+        # FastAPI's json.loads into Python objects first
+        anime = AnimeCreate.model_validate_json(body)
+    except ValidationError as err:
+        raise RequestValidationError(
+            [{**e, "loc": ("body", *e["loc"])} for e in err.errors(include_url=False)]
+        )
+
+    # Each anime gets its own UUID; stored as an AnimeRecord
+    data = anime.model_dump()
+    now = datetime.utcnow()
+    data.update(id=uuid4(), created_at=now, updated_at=now)
+    record = _anime_record(data)
+    with _store_lock:
+        _save_anime(record)
+        blob = animes[record.id][1]
+    return _json_bytes(blob, status_code=201)
+
+@app.get("/animes", responses={200: {"model": List[AnimeRead]}})
 def list_animes(
     title: Optional[str] = Query(None, description="Filter by title"),
     genre: Optional[str] = Query(None, description="Filter by genre"),
-    seasons: Optional[str] = Query(None, description="Filter by seasons"),
-    rating: Optional[str] = Query(None, description="Filter by rating"),
+    seasons: Optional[int] = Query(None, description="Filter by seasons"),
+    rating: Optional[int] = Query(None, description="Filter by rating"),
     status: Optional[str] = Query(None, description="Filter by status"),
     streaming: Optional[str] = Query(None, description="Filter by streaming"),
     role: Optional[str] = Query(None, description="Filter by role"),
     gender: Optional[str] = Query(None, description="Filter by gender"),
 ):
-    results = list(animes.values())
-
-    if title is not None:
-        results = [p for p in results if p.title == title]
-    if genre is not None:
-        results = [p for p in results if p.genre == genre]
-    if seasons is not None:
-        results = [p for p in results if p.seasons == seasons]
-    if rating is not None:
-        results = [p for p in results if p.rating == rating]
-    if status is not None:
-        results = [p for p in results if p.status == status]
-    if streaming is not None:
-        results = [p for p in results if str(p.streaming) == streaming]
-
+    ids = _lookup(anime_index, {
+        "title": title, "genre": genre, "seasons": seasons,
+        "rating": rating, "status": status, "streaming": streaming,
+    })
     # nested character filtering
-    if role is not None:
-        results = [p for p in results if any(char.role == role for char in p.characters)]
-    if gender is not None:
-        results = [p for p in results if any(char.gender == gender for char in p.addresses)]
+    ids = _lookup(anime_character_index, {"role": role, "gender": gender}, ids)
 
-    return results
+    if ids is None:
+        return _json_array([blob for _, blob in list(animes.values())])
+    return _json_array([animes[i][1] for i in sorted(ids, key=anime_seq.__getitem__)])
 
-@app.get("/animes/{anime_id}", response_model=AnimeRead)
+@app.get("/animes/{anime_id}", responses={200: {"model": AnimeRead}})
 def get_anime(anime_id: UUID):
     if anime_id not in animes:
         raise HTTPException(status_code=404, detail="Anime not found")
-    return animes[anime_id]
+    return _json_bytes(animes[anime_id][1])
 
 @app.patch("/animes/{anime_id}", response_model=AnimeRead)
 def update_anime(anime_id: UUID, update: AnimeUpdate):
-    if anime_id not in animes:
-        raise HTTPException(status_code=404, detail="Anime not found")
-    stored = animes[anime_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    animes[anime_id] = AnimeRead(**stored)
-    return animes[anime_id]
+    with _store_lock:
+        if anime_id not in animes:
+            raise HTTPException(status_code=404, detail="Anime not found")
+        # Copy the stored record, touching only the fields the client sent
+        patch = _patch(update, AnimeRead)
+        if "characters" in patch:
+            patch["characters"] = [CharacterRecord(**c.model_dump()) for c in update.characters]
+        record = replace(animes[anime_id][0], **patch, updated_at=datetime.utcnow())
+        _save_anime(record)
+    return record
 
 
 # -----------------------------------------------------------------------------
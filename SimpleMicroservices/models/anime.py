@@ -1,11 +1,32 @@
 from __future__ import annotations
 
 from typing import Optional, List, Annotated
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, Field
 from .characters import CharacterBase
 
+# Examples shared by several models below (OpenAPI docs only). The embedded
+# character has its own id, distinct from the one in characters.py.
+_NARUTO_CAST_MEMBER_EXAMPLE = {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "name": "Naruto Uzumaki",
+    "role": "Protagonist",
+    "alias": "Seventh Hokage",
+    "gender": "Male",
+    "ability": "Nine-Tails Chakra, Sage of six-paths",
+}
+
+_NARUTO_EXAMPLE = {
+    "title": "Naruto",
+    "genre": "Comedy/Action",
+    "seasons": 9,
+    "rating": 5,
+    "status": "Ongoing",
+    "streaming": "Netflix/Crunchyroll",
+    "characters": [_NARUTO_CAST_MEMBER_EXAMPLE],
+}
+
 class AnimeBase(BaseModel):
     title: str = Field(
         ...,
@@ -17,15 +38,19 @@ class AnimeBase(BaseModel):
         description="Genre of the anime.",
         json_schema_extra={"example": "Comedy/Action"},
     )
-    seasons: str = Field(
+    seasons: int = Field(
         ...,
+        ge=0,
+        le=1000,
         description="Number of seasons the anime was playing.",
-        json_schema_extra={"example": "9"},
+        json_schema_extra={"example": 9},
     )
-    rating: Optional[str] = Field(
+    rating: Optional[int] = Field(
         None,
-        description="Rating of the anime.",
-        json_schema_extra={"example": "5"},
+        ge=0,
+        le=10,
+        description="Rating of the anime, from 0 to 10.",
+        json_schema_extra={"example": 5},
     )
     status: str = Field(
         ...,
@@ -42,43 +67,13 @@ class AnimeBase(BaseModel):
     characters: List[CharacterBase] = Field(
         default_factory=list,
         description="Characters linked to this Anime (each carries a persistent Character ID).",
-        json_schema_extra={
-            "example": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "name": "Naruto Uzumaki",
-                    "role": "Protagonist",
-                    "alias": "Seventh Hokage",
-                    "gender": "Male",
-                    "ability": "Nine-Tails Chakra, Sage of six-paths",
-                }
-            ]
-        },
+        json_schema_extra={"example": [_NARUTO_CAST_MEMBER_EXAMPLE]},
     )
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "title": "Naruto",
-                    "genre": "Comedy/Action",
-                    "seasons": "9",
-                    "rating": "5",
-                    "status": "Ongoing",
-                    "streaming": "Netflix/Crunchyroll",
-                    "characters": [
-                        {
-                            "id": "550e8400-e29b-41d4-a716-446655440000",
-                            "name": "Naruto Uzumaki",
-                            "role": "Protagonist",
-                            "alias": "Seventh Hokage",
-                            "gender": "Male",
-                            "ability": "Nine-Tails Chakra, Sage of six-paths",
-                        }
-                    ],
-                }
-            ]
-        }
+        "extra": "forbid",
+        "frozen": True,
+        "json_schema_extra": {"examples": [_NARUTO_EXAMPLE]}
     }
 
 
@@ -90,8 +85,8 @@ class AnimeCreate(AnimeBase):
                 {
                     "title": "Attack on Titan",
                     "genre": "Action",
-                    "seasons": "4",
-                    "rating": "5",
+                    "seasons": 4,
+                    "rating": 5,
                     "status": "Completed",
                     "streaming": "Crunchyroll",
                     "characters": [
@@ -122,15 +117,19 @@ class AnimeUpdate(BaseModel):
         description="Genre of the anime.",
         json_schema_extra={"example": "Comedy/Action"},
     )
-    seasons: Optional[str] = Field(
+    seasons: Optional[int] = Field(
         None,
+        ge=0,
+        le=1000,
         description="Number of seasons the anime was playing.",
-        json_schema_extra={"example": "9"},
+        json_schema_extra={"example": 9},
     )
-    rating: Optional[str] = Field(
+    rating: Optional[int] = Field(
         None,
-        description="Rating of the anime.",
-        json_schema_extra={"example": "5"},
+        ge=0,
+        le=10,
+        description="Rating of the anime, from 0 to 10.",
+        json_schema_extra={"example": 5},
     )
     status: Optional[str] = Field(
         None,
@@ -160,6 +159,8 @@ class AnimeUpdate(BaseModel):
     )
 
     model_config = {
+        "extra": "forbid",
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -177,8 +178,8 @@ class AnimeUpdate(BaseModel):
                 {
                     "title": "Solo Leveling",
                     "genre": "Action",
-                    "seasons": "2",
-                    "rating": "4",
+                    "seasons": 2,
+                    "rating": 4,
                     "status": "Ongoing",
                     "streaming": "Crunchyroll",
                 },
@@ -191,17 +192,17 @@ class AnimeUpdate(BaseModel):
 class AnimeRead(AnimeBase):
     """Server representation returned to clients."""
     id: UUID = Field(
-        default_factory=uuid4,
+        ...,
         description="Server-generated Person ID.",
         json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
@@ -211,22 +212,7 @@ class AnimeRead(AnimeBase):
             "examples": [
                 {
                     "id": "99999999-9999-4999-8999-999999999999",
-                    "title": "Naruto",
-                    "genre": "Comedy/Action",
-                    "seasons": "9",
-                    "rating": "5",
-                    "status": "Ongoing",
-                    "streaming": "Netflix/Crunchyroll",
-                    "characters": [
-                        {
-                            "id": "550e8400-e29b-41d4-a716-446655440000",
-                            "name": "Naruto Uzumaki",
-                            "role": "Protagonist",
-                            "alias": "Seventh Hokage",
-                            "gender": "Male",
-                            "ability": "Nine-Tails Chakra, Sage of six-paths",
-                        }
-                    ],
+                    **_NARUTO_EXAMPLE,
                     "created_at": "2025-01-15T10:20:30Z",
                     "updated_at": "2025-01-16T12:00:00Z",
                 }
@@ -5,6 +5,16 @@ from uuid import UUID, uuid4
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+# Example shared by CharacterBase and CharacterRead (OpenAPI docs only).
+_NARUTO_UZUMAKI_EXAMPLE = {
+    "id": "550e8400-e29b-41d4-a716-446655440011",
+    "name": "Naruto Uzumaki",
+    "role": "Protagonist",
+    "alias": "Seventh Hokage",
+    "gender": "Male",
+    "ability": "Nine-Tails Chakra, Sage of six-paths",
+}
+
 
 class CharacterBase(BaseModel):
     id: UUID = Field(
@@ -27,7 +37,7 @@ class CharacterBase(BaseModel):
         description="Alias or Nickname of the character.",
         json_schema_extra={"example": "Seventh Hokage"},
     )
-    gender: str = Field(
+    gender: Optional[str] = Field(
         None,
         description="Gender of the character.",
         json_schema_extra={"example": "Male"},
@@ -39,18 +49,9 @@ class CharacterBase(BaseModel):
     )
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440011",
-                    "name": "Naruto Uzumaki",
-                    "role": "Protagonist",
-                    "alias": "Seventh Hokage",
-                    "gender": "Male",
-                    "ability": "Nine-Tails Chakra, Sage of six-paths",
-                }
-            ]
-        }
+        "extra": "forbid",
+        "frozen": True,
+        "json_schema_extra": {"examples": [_NARUTO_UZUMAKI_EXAMPLE]}
     }
 
 
@@ -89,7 +90,7 @@ class CharacterUpdate(BaseModel):
         description="Alias or Nickname of the character.",
         json_schema_extra={"example": "Humanity's Strongest Soldier"},
     )
-    gender: str = Field(
+    gender: Optional[str] = Field(
         None,
         description="Gender of the character.",
         json_schema_extra={"example": "Male"},
@@ -101,6 +102,8 @@ class CharacterUpdate(BaseModel):
     )
 
     model_config = {
+        "extra": "forbid",
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -120,12 +123,12 @@ class CharacterUpdate(BaseModel):
 
 class CharacterRead(CharacterBase):
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
@@ -134,12 +137,7 @@ class CharacterRead(CharacterBase):
         "json_schema_extra": {
             "examples": [
                 {
-                    "id": "550e8400-e29b-41d4-a716-446655440011",
-                    "name": "Naruto Uzumaki",
-                    "role": "Protagonist",
-                    "alias": "Seventh Hokage",
-                    "gender": "Male",
-                    "ability": "Nine-Tails Chakra, Sage of six-paths",
+                    **_NARUTO_UZUMAKI_EXAMPLE,
                     "created_at": "2025-01-15T10:20:30Z",
                     "updated_at": "2025-01-16T12:00:00Z",
                 }
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+
+# Internal storage records. The Pydantic models validate at the API boundary;
+# once accepted, data is kept in these slotted dataclasses, which orjson can
+# serialize natively.
+
+@dataclass(slots=True)
+class CharacterRecord:
+    """Character as embedded in an anime (mirrors CharacterBase)."""
+    id: UUID
+    name: str
+    role: str
+    alias: Optional[str]
+    gender: Optional[str]
+    ability: str
+
+
+@dataclass(slots=True)
+class CharacterReadRecord(CharacterRecord):
+    """Stored character resource (mirrors CharacterRead)."""
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True)
+class AnimeRecord:
+    """Stored anime resource (mirrors AnimeRead)."""
+    title: str
+    genre: str
+    seasons: int
+    rating: Optional[int]
+    status: str
+    streaming: str
+    characters: List[CharacterRecord]
+    id: UUID
+    created_at: datetime
+    updated_at: datetime